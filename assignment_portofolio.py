@@ -2,10 +2,16 @@ import streamlit as st
 import pandas as pd 
 import numpy as np 
 import pickle
+import os
+import warnings
 import plotly.express as px 
 import plotly.graph_objects as go 
+import plotly.colors as pc
 from datetime import datetime, timedelta
 
+# Nama hari sesuai urutan datetime.weekday() (Senin = 0)
+DAYS = ('Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu')
+
 # --- Konfigurasi Halaman (Harus di awal skrip) ---
 st.set_page_config(
     page_title="Dashboard Analisis Penjualan",
@@ -17,17 +23,225 @@ st.set_page_config(
 # --- Fungsi untuk Memuat Data Dummy Penjualan (Menggunakan Cache untuk Performa) ---
 @st.cache_data
 def load_data():
-    return pd.read_csv("data/retail_store.csv")
+    # Hanya kolom yang benar-benar dipakai dashboard yang dimuat
+    used_columns = [
+        'OrderID', 'Tanggal_Pesanan', 'Produk', 'Kategori', 'Wilayah', 'Jumlah',
+        'Harga_Satuan', 'Metode_Pembayaran', 'Diskon', 'Total_Penjualan', 'Bulan'
+    ]
+    parquet_path = "data/retail_store.parquet"
+    csv_path = "data/retail_store.csv"
+    # Parquet hanya dipakai jika tidak lebih lama dari CSV; jika CSV sudah diperbarui
+    # tetapi convert_to_parquet.py belum dijalankan ulang, baca CSV agar data tidak basi
+    use_parquet = os.path.exists(parquet_path) and (
+        not os.path.exists(csv_path) or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+    )
+    if use_parquet:
+        # Parquet (hasil convert_to_parquet.py) sudah menyimpan tipe kolom -> tidak perlu parsing teks ulang
+        df = pd.read_parquet(parquet_path, columns=used_columns)
+    else:
+        # Kolom berkardinalitas rendah dijadikan 'category' agar isin()/groupby() memakai kode integer, bukan string
+        df = pd.read_csv(
+            csv_path,
+            usecols=used_columns,
+            dtype={
+                'Wilayah': 'category',
+                'Kategori': 'category',
+                'Metode_Pembayaran': 'category',
+                'Produk': 'category'
+            },
+            parse_dates=['Tanggal_Pesanan'] # Langsung diparsing ke datetime saat dibaca
+        )
+    # Kolom integer diperkecil tipenya (lossless); kolom float (Total_Penjualan, Diskon) tetap float64 agar presisi
+    df = df.astype({'Jumlah': 'int16', 'Harga_Satuan': 'int32'})
+    # Diurutkan berdasarkan tanggal agar filter rentang tanggal cukup memakai searchsorted
+    df = df.sort_values('Tanggal_Pesanan', ignore_index=True)
+    # Bulan sebagai Period -> urutan kronologis tanpa parsing ulang string 'YYYY-MM'
+    df['_BulanPeriod'] = df['Tanggal_Pesanan'].dt.to_period('M')
+    # Opsi filter & batas rentang tanggal dihitung sekali di sini, bukan di setiap rerun
+    # Diambil dari daftar kategori (urutan tetap, tanpa scan), bukan unique() yang bergantung pada urutan baris
+    regions = df['Wilayah'].cat.categories.tolist()
+    categories = df['Kategori'].cat.categories.tolist()
+    min_date = df['Tanggal_Pesanan'].min().date()
+    max_date = df['Tanggal_Pesanan'].max().date()
+    # Nilai default slider di halaman Prediksi
+    stats = {
+        'jumlah_mean': float(df['Jumlah'].mean()),
+        'harga_mean': float(df['Harga_Satuan'].mean()),
+        'diskon_mean': float(df['Diskon'].mean())
+    }
+    return df, regions, categories, min_date, max_date, stats
 
 # Load data penjualan
-df_sales = load_data()
-df_sales['Tanggal_Pesanan'] = pd.to_datetime(df_sales['Tanggal_Pesanan']) # Mengubah ke datetime
+df_sales, regions, categories, min_date, max_date, stats = load_data()
+
+# --- Fungsi Filter & Agregasi (Menggunakan Cache agar tidak dihitung ulang di setiap rerun) ---
+# max_entries membatasi jumlah kombinasi filter yang disimpan agar cache tidak tumbuh tanpa batas
+# Yang di-cache hanya posisi baris (array integer kecil), bukan salinan DataFrame hasil filter
+@st.cache_data(max_entries=32)
+def filter_positions(start, end, filter_regions, filter_categories):
+    lo, hi = 0, len(df_sales)
+    # start/end bernilai None jika rentang tanggal belum lengkap
+    if start is not None and end is not None:
+        # df_sales terurut per tanggal -> rentang tanggal = potongan baris [lo, hi), dicari dalam O(log N)
+        dates = df_sales['Tanggal_Pesanan'].to_numpy()
+        lo = np.searchsorted(dates, pd.to_datetime(start).to_datetime64(), side='left')
+        hi = np.searchsorted(dates, pd.to_datetime(end).to_datetime64(), side='right')
+    base = df_sales.iloc[lo:hi]
+    # Satu mask gabungan atas potongan tanggal, lalu digeser kembali ke posisi di df_sales
+    mask = (base['Wilayah'].isin(filter_regions).to_numpy() &
+            base['Kategori'].isin(filter_categories).to_numpy())
+    return lo + np.flatnonzero(mask)
+
+def get_filtered(start, end, filter_regions, filter_categories):
+    # DataFrame hanya di-index (disalin) sekali dari df_sales memakai posisi yang sudah di-cache
+    return df_sales.iloc[filter_positions(start, end, filter_regions, filter_categories)]
+
+@st.cache_data(max_entries=32)
+def agg_by(filter_key, col, sort=False):
+    # filter_key = (start, end, regions, categories) -> tuple yang stabil sebagai kunci cache
+    filtered = get_filtered(*filter_key)
+    # observed=True: hanya kategori yang muncul di data; sort hanya jika urutan sumbu penting
+    return filtered.groupby(col, observed=True, sort=sort)['Total_Penjualan'].sum().reset_index()
+
+@st.cache_data(max_entries=32)
+def top_n_by(filter_key, col, n=10):
+    sales = agg_by(filter_key, col)
+    vals = sales['Total_Penjualan'].to_numpy()
+    names = sales[col].to_numpy()
+    # argpartition memilih n teratas dalam O(N), tanpa mengurutkan seluruh hasil agregasi
+    if len(vals) > n:
+        idx = np.argpartition(-vals, n)[:n]
+        vals, names = vals[idx], names[idx]
+    return pd.DataFrame({col: names, 'Total_Penjualan': vals}).sort_values('Total_Penjualan')
+
+@st.cache_data(max_entries=32)
+def describe_by(filter_key):
+    # Statistik deskriptif hanya dihitung ulang jika filter berubah
+    return get_filtered(*filter_key).describe()
+
+# --- Fungsi Pembuat Grafik ---
+# Grafik dibangun langsung dengan plotly.graph_objects (lebih ringan daripada Plotly Express),
+# sengaja tanpa cache: unpickle Figure dari st.cache_data sama mahalnya dengan membangunnya ulang
+def _cycle_colors(palette, n):
+    # Ulangi palet warna agar cukup untuk n batang
+    return [palette[i % len(palette)] for i in range(n)]
+
+def build_monthly_fig(sales_by_month):
+    fig = go.Figure(go.Scatter(
+        x=sales_by_month['Bulan'],              # Sumbu X: bulan (format string seperti '2024-01')
+        y=sales_by_month['Total_Penjualan'],    # Sumbu Y: total penjualan
+        mode='lines+markers',                   # Menampilkan titik pada setiap nilai (marker)
+        line=dict(shape='spline', color='#2ca02c'),  # Garis melengkung berwarna hijau
+        hovertext=sales_by_month['Bulan'],      # Menampilkan nama bulan saat kursor diarahkan ke titik
+        hovertemplate='<b>%{hovertext}</b><br><br>Bulan=%{x}<br>Total_Penjualan=%{y}<extra></extra>'
+    ))
+    fig.update_layout(
+        title='Total Penjualan per Bulan',  # Judul grafik
+        xaxis_title='Bulan',
+        yaxis_title='Total_Penjualan',
+        height=400                          # Tinggi grafik dalam piksel
+    )
+    return fig
+
+def build_top_products_fig(top_products_sales):
+    vals = top_products_sales['Total_Penjualan'].to_numpy()
+    # Warna tiap batang diambil langsung dari skala Plasma_r (gradasi terang ke gelap) sesuai nilainya
+    colors = pc.sample_colorscale('Plasma_r', ((vals - vals.min()) / (np.ptp(vals) or 1)).tolist())
+    # Horizontal bar: panjang batang = total penjualan, warna batang berdasarkan nilai
+    fig = go.Figure(go.Bar(
+        x=vals,
+        y=top_products_sales['Produk'],
+        orientation='h',
+        marker_color=colors
+    ))
+
+    # Sortir kategori (produk) berdasarkan nilai total penjualan (ascending)
+    fig.update_layout(
+        title='Top 10 Produk Berdasarkan Total Penjualan',
+        xaxis_title='Total_Penjualan',
+        yaxis_title='Produk',
+        height=400,
+        yaxis={'categoryorder':'total ascending'}
+    )
+    return fig
+
+def build_category_pie(sales_by_category):
+    # Buat pie chart (donut style) berdasarkan proporsi penjualan tiap kategori
+    fig = go.Figure(go.Pie(
+        labels=sales_by_category['Kategori'],       # Label di pie chart
+        values=sales_by_category['Total_Penjualan'],  # Nilai yang diplot (besarannya)
+        hole=0.3,                                   # Membuat pie menjadi donut chart (ada lubangnya)
+        marker=dict(colors=px.colors.qualitative.Set2)  # Skema warna yang friendly
+    ))
+    fig.update_layout(title='Proporsi Penjualan per Kategori')
+    return fig
+
+def build_payment_fig(sales_by_payment):
+    # Buat bar chart berdasarkan metode pembayaran
+    fig = go.Figure(go.Bar(
+        x=sales_by_payment['Metode_Pembayaran'],
+        y=sales_by_payment['Total_Penjualan'],
+        marker_color=_cycle_colors(px.colors.qualitative.Vivid, len(sales_by_payment))  # Skema warna cerah
+    ))
+    fig.update_layout(
+        title='Total Penjualan per Metode Pembayaran',
+        xaxis_title='Metode_Pembayaran',
+        yaxis_title='Total_Penjualan'
+    )
+    return fig
+
+def build_region_fig(sales_by_region):
+    # Buat bar chart berdasarkan wilayah
+    fig = go.Figure(go.Bar(
+        x=sales_by_region['Wilayah'],
+        y=sales_by_region['Total_Penjualan'],
+        marker_color=_cycle_colors(px.colors.qualitative.Safe, len(sales_by_region))  # Warna yang lebih lembut
+    ))
+    fig.update_layout(
+        title='Total Penjualan per Wilayah',
+        xaxis_title='Wilayah',
+        yaxis_title='Total_Penjualan'
+    )
+    return fig
+
+# --- Fragment Eksplorasi Data Mentah ---
+# st.fragment: interaksi slider/checkbox di sini hanya menjalankan ulang fungsi ini, bukan seluruh halaman
+@st.fragment
+def raw_data_view(df, filter_key):
+    # Penjelasan singkat
+    st.write("Berikut adalah sebagian kecil dari data transaksi yang digunakan untuk dashboard ini.")
+    
+    # Slider untuk memilih berapa banyak baris data yang ingin ditampilkan
+    num_rows_to_display = st.slider(
+        "Jumlah Baris Data yang Ditampilkan:",
+        min_value=10, # Nilai terkecil yang bisa dipilih pengguna (slider mulai dari angka 10)
+        max_value=200, # Nilai terbesar yang bisa dipilih pengguna (slider mentok di 200)
+        value=50, # Nilai default saat slider muncul pertama kali
+        step=10 # Jarak antar nilai pada slider (misalnya: 10, 20, 30, ..., 200)
+    )
+
+    # Tampilkan tabel data sesuai jumlah baris yang dipilih (tanpa kolom bantu _BulanPeriod);
+    # kategori yang tidak muncul di sampel dibuang agar tabel Arrow yang dikirim ke browser lebih kecil
+    sample = df.head(num_rows_to_display).drop(columns='_BulanPeriod')
+    for col in sample.select_dtypes('category'):
+        sample[col] = sample[col].cat.remove_unused_categories()
+    st.dataframe(sample)
+    
+    # Isi expander tetap dieksekusi walau tertutup, jadi statistik deskriptif
+    # (count, mean, std, min, max, dsb) hanya dihitung jika pengguna memintanya
+    if st.checkbox("Tampilkan Statistik Deskriptif"):
+        st.write("Statistik Deskriptif:")
+        st.dataframe(describe_by(filter_key))
+
 
 # --- Fungsi untuk Melatih Model Regresi (Menggunakan Cache) ---
 @st.cache_resource
 def load_model():
     with open("model/model_sales.pkl", "rb") as f:
         sales_prediction_model, model_features, base_month_ordinal = pickle.load(f)
+    # Model dilatih dengan DataFrame; input prediksi sengaja berupa array tanpa nama kolom.
+    # Filter didaftarkan di sini karena st.cache_resource hanya menjalankan fungsi ini sekali per proses
+    warnings.filterwarnings("ignore", message="X does not have valid feature names", module="sklearn")
     return sales_prediction_model, model_features, base_month_ordinal
 
 # Load model
@@ -52,9 +266,6 @@ pilihan_halaman = st.sidebar.radio(
 if pilihan_halaman == "Overview Dashboard":
     st.sidebar.markdown("### Filter Data Dashboard")
     # Filter berdasarkan tanggal (rentang)
-    min_date = df_sales['Tanggal_Pesanan'].min().date()
-    max_date = df_sales['Tanggal_Pesanan'].max().date()
-
     date_range = st.sidebar.date_input(
         "Pilih Rentang Tanggal:",
         value=(min_date, max_date),
@@ -64,32 +275,34 @@ if pilihan_halaman == "Overview Dashboard":
 
     # Pastikan date_range memiliki 2 elemen
     if len(date_range) == 2:
-        start_date_filter = pd.to_datetime(date_range[0])
-        end_date_filter = pd.to_datetime(date_range[1])
-        filtered_df = df_sales[(df_sales['Tanggal_Pesanan'] >= start_date_filter) & 
-                               (df_sales['Tanggal_Pesanan'] <= end_date_filter)]
+        start_date_filter, end_date_filter = date_range
     else:
         # Handle case where only one date is selected (e.g., initial state)
-        filtered_df = df_sales
+        start_date_filter, end_date_filter = None, None
 
 
     # Filter berdasarkan Wilayah
     selected_regions = st.sidebar.multiselect(
         "Pilih Wilayah:",
-        options=df_sales['Wilayah'].unique().tolist(),
-        default=df_sales['Wilayah'].unique().tolist()
+        options=regions,
+        default=regions
     )
-    filtered_df = filtered_df[filtered_df['Wilayah'].isin(selected_regions)]
 
     # Filter berdasarkan Kategori Produk
     selected_categories = st.sidebar.multiselect(
         "Pilih Kategori Produk:",
-        options=df_sales['Kategori'].unique().tolist(),
-        default=df_sales['Kategori'].unique().tolist()
+        options=categories,
+        default=categories
     )
-    filtered_df = filtered_df[filtered_df['Kategori'].isin(selected_categories)]
-else: # If on Prediction Page, use full df for the model
-    filtered_df = df_sales.copy()
+
+    # Kunci filter: dipakai ulang oleh semua agregasi selama filter tidak berubah
+    filter_key = (
+        start_date_filter,
+        end_date_filter,
+        tuple(sorted(selected_regions)),
+        tuple(sorted(selected_categories))
+    )
+    filtered_df = get_filtered(*filter_key)
 
 
 # Jika tidak ada data setelah filter (hanya relevan di Overview)
@@ -106,10 +319,12 @@ if pilihan_halaman == "Overview Dashboard":
 
     col1, col2, col3, col4 = st.columns(4)
 
-    total_sales = filtered_df['Total_Penjualan'].sum()
-    total_orders = filtered_df['OrderID'].nunique()
+    # Semua KPI dihitung dalam satu pemanggilan agg()
+    kpi = filtered_df.agg({'Total_Penjualan': 'sum', 'OrderID': 'nunique', 'Jumlah': 'sum'})
+    total_sales = kpi['Total_Penjualan']
+    total_orders = int(kpi['OrderID'])
     avg_order_value = total_sales / total_orders if total_orders > 0 else 0
-    total_products_sold = filtered_df['Jumlah'].sum()
+    total_products_sold = int(kpi['Jumlah'])
 
     with col1:
         st.metric(label="Total Penjualan", value=f"Rp {total_sales:,.2f}")
@@ -124,25 +339,11 @@ if pilihan_halaman == "Overview Dashboard":
 
     # --- Tren Penjualan Bulanan (Line Chart) ---
     st.subheader("📈 Tren Penjualan Bulanan")
-    sales_by_month = filtered_df.groupby('Bulan')['Total_Penjualan'].sum().reset_index()
-    # Pastikan urutan bulan benar
-    sales_by_month['Bulan'] = pd.to_datetime(sales_by_month['Bulan']).dt.to_period('M')
-    sales_by_month = sales_by_month.sort_values('Bulan')
-    sales_by_month['Bulan'] = sales_by_month['Bulan'].astype(str) # Kembali ke string untuk Plotly
-
-    fig_monthly_sales = px.line(
-        sales_by_month,             # Data agregat penjualan per bulan (DataFrame)
-        x='Bulan',                  # Sumbu X: bulan (format string seperti '2024-01')
-        y='Total_Penjualan',        # Sumbu Y: total penjualan
-        title='Total Penjualan per Bulan',  # Judul grafik
-        markers=True,               # Menampilkan titik pada setiap nilai (marker)
-        line_shape="spline",        # Membuat garis melengkung (bukan garis lurus biasa)
-        hover_name='Bulan',         # Menampilkan nama bulan saat kursor diarahkan ke titik
-        height=400                  # Tinggi grafik dalam piksel
-    )
+    # Grouping langsung pada Period (sudah terurut kronologis oleh groupby)
+    sales_by_month = agg_by(filter_key, '_BulanPeriod', sort=True)
+    sales_by_month['Bulan'] = sales_by_month['_BulanPeriod'].astype(str) # String untuk sumbu Plotly
 
-    # Update warna garis menjadi hijau
-    fig_monthly_sales.update_traces(line_color='#2ca02c')
+    fig_monthly_sales = build_monthly_fig(sales_by_month)
 
     # Menampilkan grafik di halaman Streamlit, lebarnya menyesuaikan container (misalnya kolom atau layar)
     st.plotly_chart(fig_monthly_sales, use_container_width=True)
@@ -158,22 +359,9 @@ if pilihan_halaman == "Overview Dashboard":
         st.write("#### Top 10 Produk Terlaris (Berdasarkan Total Penjualan)")
 
         # Agregasi total penjualan per produk, ambil 10 produk dengan penjualan tertinggi
-        top_products_sales = filtered_df.groupby('Produk')['Total_Penjualan'].sum().nlargest(10).reset_index()
-
-        # Membuat horizontal bar chart menggunakan Plotly Express
-        fig_top_products = px.bar(
-            top_products_sales,
-            x='Total_Penjualan',     # Panjang batang = total penjualan
-            y='Produk',              # Y axis = nama produk
-            orientation='h',         # Horizontal bar
-            title='Top 10 Produk Berdasarkan Total Penjualan',
-            color='Total_Penjualan', # Warna batang berdasarkan nilai
-            color_continuous_scale=px.colors.sequential.Plasma[::-1],  # Gradasi warna dari terang ke gelap
-            height=400
-        )
+        top_products_sales = top_n_by(filter_key, 'Produk', n=10)
 
-        # Sortir kategori (produk) berdasarkan nilai total penjualan (ascending)
-        fig_top_products.update_layout(yaxis={'categoryorder':'total ascending'})
+        fig_top_products = build_top_products_fig(top_products_sales)
 
         # Tampilkan grafik di Streamlit
         st.plotly_chart(fig_top_products, use_container_width=True)
@@ -183,17 +371,10 @@ if pilihan_halaman == "Overview Dashboard":
         st.write("#### Distribusi Penjualan per Kategori")
 
         # Agregasi total penjualan berdasarkan kategori
-        sales_by_category = filtered_df.groupby('Kategori')['Total_Penjualan'].sum().reset_index()
-
-        # Buat pie chart (donut style) berdasarkan proporsi penjualan tiap kategori
-        fig_category_pie = px.pie(
-            sales_by_category,
-            values='Total_Penjualan',    # Nilai yang diplot (besarannya)
-            names='Kategori',            # Label di pie chart
-            title='Proporsi Penjualan per Kategori',
-            hole=0.3,                    # Membuat pie menjadi donut chart (ada lubangnya)
-            color_discrete_sequence=px.colors.qualitative.Set2  # Skema warna yang friendly
-        )
+        # sort=True: urutan baris (dan warna Set2 di pie) tetap stabil saat filter berubah
+        sales_by_category = agg_by(filter_key, 'Kategori', sort=True)
+
+        fig_category_pie = build_category_pie(sales_by_category)
 
         # Tampilkan chart di Streamlit
         st.plotly_chart(fig_category_pie, use_container_width=True)
@@ -212,21 +393,9 @@ if pilihan_halaman == "Overview Dashboard":
         st.write("#### Penjualan Berdasarkan Metode Pembayaran")
 
         # Hitung total penjualan per metode pembayaran
-        sales_by_payment = (
-            filtered_df.groupby('Metode_Pembayaran')['Total_Penjualan']
-            .sum()
-            .reset_index()
-        )
+        sales_by_payment = agg_by(filter_key, 'Metode_Pembayaran', sort=True)
 
-        # Buat bar chart berdasarkan metode pembayaran
-        fig_payment = px.bar(
-            sales_by_payment,
-            x='Metode_Pembayaran',
-            y='Total_Penjualan',
-            title='Total Penjualan per Metode Pembayaran',
-            color='Metode_Pembayaran',
-            color_discrete_sequence=px.colors.qualitative.Vivid  # Skema warna cerah
-        )
+        fig_payment = build_payment_fig(sales_by_payment)
 
         # Tampilkan chart di Streamlit
         st.plotly_chart(fig_payment, use_container_width=True)
@@ -236,21 +405,9 @@ if pilihan_halaman == "Overview Dashboard":
         st.write("#### Penjualan Berdasarkan Wilayah")
 
         # Hitung total penjualan per wilayah
-        sales_by_region = (
-            filtered_df.groupby('Wilayah')['Total_Penjualan']
-            .sum()
-            .reset_index()
-        )
+        sales_by_region = agg_by(filter_key, 'Wilayah', sort=True)
 
-        # Buat bar chart berdasarkan wilayah
-        fig_region = px.bar(
-            sales_by_region,
-            x='Wilayah',
-            y='Total_Penjualan',
-            title='Total Penjualan per Wilayah',
-            color='Wilayah',
-            color_discrete_sequence=px.colors.qualitative.Safe  # Warna yang lebih lembut
-        )
+        fig_region = build_region_fig(sales_by_region)
 
         # Tampilkan chart di Streamlit
         st.plotly_chart(fig_region, use_container_width=True)
@@ -264,25 +421,7 @@ if pilihan_halaman == "Overview Dashboard":
 
     # Buat area yang bisa diklik untuk expand/collapse
     with st.expander("Klik untuk melihat detail data transaksi"):
-
-        # Penjelasan singkat
-        st.write("Berikut adalah sebagian kecil dari data transaksi yang digunakan untuk dashboard ini.")
-        
-        # Slider untuk memilih berapa banyak baris data yang ingin ditampilkan
-        num_rows_to_display = st.slider(
-            "Jumlah Baris Data yang Ditampilkan:",
-            min_value=10, # Nilai terkecil yang bisa dipilih pengguna (slider mulai dari angka 10)
-            max_value=200, # Nilai terbesar yang bisa dipilih pengguna (slider mentok di 200)
-            value=50, # Nilai default saat slider muncul pertama kali
-            step=10 # Jarak antar nilai pada slider (misalnya: 10, 20, 30, ..., 200)
-        )
-
-        # Tampilkan tabel data sesuai jumlah baris yang dipilih
-        st.dataframe(filtered_df.head(num_rows_to_display))
-        
-        # Tampilkan statistik deskriptif (count, mean, std, min, max, dsb)
-        st.write("Statistik Deskriptif:")
-        st.dataframe(filtered_df.describe())
+        raw_data_view(filtered_df, filter_key)
 
 
 elif pilihan_halaman == "Prediksi Penjualan":
@@ -300,19 +439,18 @@ elif pilihan_halaman == "Prediksi Penjualan":
         target_date_ordinal = target_date.toordinal()
 
         # Input untuk rata-rata Jumlah produk per pesanan
-        avg_quantity = st.slider("Rata-rata Jumlah Produk per Pesanan:", min_value=1.0, max_value=5.0, value=df_sales['Jumlah'].mean(), step=0.1)
+        avg_quantity = st.slider("Rata-rata Jumlah Produk per Pesanan:", min_value=1.0, max_value=5.0, value=stats['jumlah_mean'], step=0.1)
 
         # Input untuk rata-rata Harga Satuan
-        avg_unit_price = st.slider("Rata-rata Harga Satuan Produk (Rp):", min_value=50.0, max_value=2000.0, value=df_sales['Harga_Satuan'].mean(), step=10.0)
+        avg_unit_price = st.slider("Rata-rata Harga Satuan Produk (Rp):", min_value=50.0, max_value=2000.0, value=stats['harga_mean'], step=10.0)
 
     with col_pred_2:
         # Input untuk rata-rata Diskon
-        avg_discount = st.slider("Rata-rata Diskon (%):", min_value=0.0, max_value=0.20, value=df_sales['Diskon'].mean(), step=0.01, format="%.2f")
+        avg_discount = st.slider("Rata-rata Diskon (%):", min_value=0.0, max_value=0.20, value=stats['diskon_mean'], step=0.01, format="%.2f")
 
         # Input untuk Hari dalam Seminggu
-        day_of_week = st.selectbox("Hari dalam Seminggu:", options=['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu'], index=datetime.now().weekday())
-        day_of_week_map = {'Senin':0, 'Selasa':1, 'Rabu':2, 'Kamis':3, 'Jumat':4, 'Sabtu':5, 'Minggu':6}
-        day_of_week_encoded = day_of_week_map[day_of_week]
+        # Opsi berupa indeks 0-6 -> nilai yang dipilih langsung menjadi encoding untuk model
+        day_of_week_encoded = st.selectbox("Hari dalam Seminggu:", options=range(7), format_func=DAYS.__getitem__, index=datetime.now().weekday())
 
         # Input untuk Jam Pesanan (misal: jam puncak transaksi)
         hour_of_day = st.slider("Jam Puncak Pesanan (0-23):", min_value=0, max_value=23, value=14, step=1)
@@ -320,15 +458,15 @@ elif pilihan_halaman == "Prediksi Penjualan":
     st.markdown("---")
 
     if st.button("Hitung Prediksi Penjualan"):
-        # Siapkan input untuk model
-        input_for_prediction = pd.DataFrame([[
+        # Siapkan input untuk model sebagai array (1, n_fitur), urutan kolom sama dengan model_features
+        input_for_prediction = np.array([[
             target_date_ordinal,
             avg_quantity,
             avg_unit_price,
             avg_discount,
             day_of_week_encoded,
             hour_of_day
-        ]], columns=model_features)
+        ]], dtype=np.float64)
 
         try:
             predicted_sales_value = sales_prediction_model.predict(input_for_prediction)[0]
@@ -343,7 +481,7 @@ elif pilihan_halaman == "Prediksi Penjualan":
             # Tampilkan fitur yang digunakan untuk prediksi
             st.markdown("---")
             st.subheader("Fitur yang Digunakan untuk Prediksi:")
-            st.write(input_for_prediction)
+            st.write(pd.DataFrame(input_for_prediction, columns=model_features))
 
         except Exception as e:
             st.error(f"Terjadi kesalahan saat melakukan prediksi: {e}. Pastikan semua input valid.")
@@ -0,0 +1,18 @@
+import pandas as pd
+
+# --- Konversi Sekali Jalan: retail_store.csv -> retail_store.parquet ---
+# Parquet menyimpan tipe kolom (category, datetime), sehingga dashboard tidak perlu
+# mem-parsing ulang teks CSV setiap kali cache load_data() kosong.
+df = pd.read_csv(
+    "data/retail_store.csv",
+    index_col=0, # Kolom pertama hanya nomor baris
+    dtype={
+        'Wilayah': 'category',
+        'Kategori': 'category',
+        'Metode_Pembayaran': 'category',
+        'Produk': 'category'
+    },
+    parse_dates=['Tanggal_Pesanan']
+)
+df.to_parquet("data/retail_store.parquet", index=False)
+print(f"Tersimpan {len(df)} baris ke data/retail_store.parquet")